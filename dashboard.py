@@ -1,8 +1,16 @@
 import streamlit as st
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import plotly.express as px
 import plotly.graph_objects as go
+import heapq
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 st.set_page_config(page_title="Crypto Dashboard", layout="wide", initial_sidebar_state="collapsed")
@@ -25,28 +33,138 @@ st.markdown("""
 st.title("🚀 Live Crypto & DeFi Dashboard")
 
 # ---------- CONFIG ----------
-col1, col2, col3 = st.columns([2, 2, 3])
+MAX_RAW_ROWS = 50  # cap on rows sent to the browser by the "View Raw Data" tables
+PROTOCOLS_URL = "https://api.llama.fi/protocols"
+POOLS_URL = "https://yields.llama.fi/pools"
+
+# (CoinGecko id, name, symbol); ids are interned since they key every price lookup
+PRICE_COINS = tuple((sys.intern(coin_id), name, symbol) for coin_id, name, symbol in (
+    ('bitcoin', 'Bitcoin', '₿'),
+    ('ethereum', 'Ethereum', 'Ξ'),
+    ('solana', 'Solana', 'SOL'),
+    ('cardano', 'Cardano', 'ADA'),
+    ('polkadot', 'Polkadot', 'DOT'),
+    ('avalanche-2', 'Avalanche', 'AVAX'),
+    ('chainlink', 'Chainlink', 'LINK'),
+    ('polygon', 'Polygon', 'MATIC'),
+))
+
+PROTOCOL_SCHEMA = pa.schema([
+    ('name', pa.string()),
+    ('category', pa.string()),
+    ('tvl', pa.float64()),
+    ('change_1d', pa.float64()),
+])
+CHAIN_SCHEMA = pa.schema([
+    ('name', pa.string()),
+    ('tvl', pa.float64()),
+])
+STABLECOIN_SCHEMA = pa.schema([
+    ('name', pa.string()),
+    ('symbol', pa.string()),
+    ('circulating', pa.struct([('peggedUSD', pa.float64())])),
+])
+POOL_SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('project', pa.string()),
+    ('chain', pa.string()),
+    ('apy', pa.float64()),
+    ('tvlUsd', pa.float64()),
+])
+
+col1, col2 = st.columns([4, 3])
 with col1:
     if st.button("🔄 Refresh Data", type="primary"):
         st.cache_data.clear()
         st.rerun()
 
 with col2:
-    min_apy = st.number_input("Min APY Filter (%)", min_value=0, max_value=100, value=10, step=5)
-
-with col3:
     st.markdown(f"**Last Updated:** {datetime.now():%Y-%m-%d %H:%M:%S}")
 
 # ---------- HELPERS ----------
-@st.cache_data(ttl=60, show_spinner=False)
-def _fetch(url, params=None):
+@st.cache_resource(show_spinner=False)
+def _session():
+    # Shared across reruns and fetch threads so TLS connections are kept alive and reused
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        # Don't sleep on Retry-After: fetch_all waits for every request, so a long
+        # rate-limit hint would hold the whole page on the spinner
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=False,
+        ),
+    ))
+    return session
+
+def _fetch(session, url, params=None, slim=None):
+    # Runs on worker threads, so no st.* calls in here; failures come back as None.
+    # `slim` trims the decoded payload before fetch_all caches it.
     try:
-        r = requests.get(url, params=params, timeout=10)
+        r = session.get(url, params=params, timeout=10)
         r.raise_for_status()
-        return r.json()
-    except Exception as e:
-        st.warning(f"⚠️ API request failed: {url}")
-        return {}
+        data = orjson.loads(r.content)
+        del r  # release the raw body before slimming
+        return slim(data) if slim else data
+    except Exception:
+        return None
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_all(reqs):
+    """Fetch every (url, params) pair concurrently; results come back in request order."""
+    session = _session()
+    with ThreadPoolExecutor(max_workers=len(reqs)) as executor:
+        return list(executor.map(lambda req: _fetch(session, *req, slim=_SLIMMERS.get(req[0])), reqs))
+
+def _frame(records, schema):
+    """DataFrame holding just the schema's fields, built column-wise by Arrow.
+
+    Struct fields are flattened into dotted columns, e.g. ``circulating.peggedUSD``.
+    Records that don't fit the schema (e.g. a numeric string) fall back to a plain
+    DataFrame with the same columns, leaving safe_num to coerce them as before.
+    """
+    try:
+        return pa.Table.from_pylist(records, schema=schema).flatten().to_pandas()
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        columns = schema.empty_table().flatten().column_names
+        return pd.json_normalize(records).reindex(columns=columns)
+
+def safe_num(df, col):
+    """Column as float64 with NaN -> 0; only takes the slow coerce path for non-numeric dtypes."""
+    s = df.get(col)
+    if s is None:
+        return 0.0
+    if s.dtype.kind in 'iuf':
+        return s.astype('float64').fillna(0)
+    return pd.to_numeric(s, errors='coerce').fillna(0)
+
+def _apy(pool):
+    # Same coercion as safe_num: numeric strings count, anything unparseable is 0
+    try:
+        return float(pool.get('apy'))
+    except (TypeError, ValueError):
+        return 0
+
+def _pick(record, schema):
+    return {f: record.get(f) for f in schema.names}
+
+def _slim_protocols(raw):
+    """Reduce a /protocols payload to the PROTOCOL_SCHEMA fields."""
+    return [_pick(p, PROTOCOL_SCHEMA) for p in raw]
+
+def _slim_pools(raw):
+    """Reduce a /pools payload to the POOL_SCHEMA fields of pools with a plottable APY."""
+    return {'data': [_pick(p, POOL_SCHEMA) for p in raw.get('data', []) if 0 < _apy(p) < 1000]}
+
+# Payload trimmers run in the fetch workers, keyed by URL
+_SLIMMERS = {PROTOCOLS_URL: _slim_protocols, POOLS_URL: _slim_pools}
+
+_fmt_usd_cents = "${:,.2f}".format
+_fmt_usd_whole = "${:,.0f}".format
+_fmt_pct = "{:+.2f}%".format
 
 def fmt_b(x): 
     if x >= 1e9:
@@ -56,6 +174,21 @@ def fmt_b(x):
     else:
         return f"${x:,.0f}"
 
+def fmt_b_vec(s):
+    """Vectorised fmt_b: formats a whole Series without a Python call per row."""
+    s = s.astype('float64')
+    whole = s.round(0).astype('int64')
+    small = (whole // 1000).astype(str) + ',' + (whole % 1000).astype(str).str.zfill(3)
+    small = small.where(whole >= 1000, whole.astype(str))
+    return pd.Series(
+        np.select(
+            [s >= 1e9, s >= 1e6],
+            ['$' + (s / 1e9).round(1).astype(str) + 'B', '$' + (s / 1e6).round(1).astype(str) + 'M'],
+            default='$' + small,
+        ),
+        index=s.index,
+    )
+
 def fmt_large(x):
     if x >= 1e9:
         return f"{x/1e9:.2f}B"
@@ -64,91 +197,160 @@ def fmt_large(x):
     else:
         return f"{x:,.0f}"
 
+# ---------- FIGURES ----------
+# Cached on the frame contents (pass only the plotted columns), so reruns with
+# unchanged data - e.g. a Min APY change for the TVL charts - reuse the built figure
+@st.cache_data(ttl=60, show_spinner=False)
+def build_protocols_chart(df):
+    fig = px.bar(
+        df, 
+        x='name', 
+        y='tvl', 
+        color='category',
+        labels={'tvl': 'TVL (USD)', 'name': 'Protocol'},
+        text=fmt_b_vec(df['tvl']),
+        hover_data={'tvl': ':,.0f', 'change_1d': ':.2f'}
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(
+        height=500, 
+        showlegend=True,
+        xaxis_tickangle=45,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+@st.cache_data(ttl=60, show_spinner=False)
+def build_chains_chart(df):
+    fig = px.bar(
+        df, 
+        x='name', 
+        y='tvl',
+        labels={'tvl': 'TVL (USD)', 'name': 'Chain'},
+        color='name', 
+        text=fmt_b_vec(df['tvl']),
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    fig.update_traces(textposition='outside', showlegend=False)
+    fig.update_layout(height=500, xaxis_tickangle=45)
+    return fig
+
+@st.cache_data(ttl=60, show_spinner=False)
+def build_stables_chart(df):
+    fig = px.pie(
+        df, 
+        names='symbol', 
+        values='circulating_usd',
+        color_discrete_sequence=px.colors.sequential.Viridis,
+        hole=0.4
+    )
+    fig.update_traces(
+        textinfo='percent+label',
+        textposition='auto',
+        hovertemplate='<b>%{label}</b><br>Market Cap: $%{value:,.0f}<extra></extra>'
+    )
+    fig.update_layout(height=450)
+    return fig
+
+@st.cache_data(ttl=60, show_spinner=False)
+def build_yields_chart(df):
+    fig = px.bar(
+        df, 
+        y='symbol', 
+        x='apy', 
+        orientation='h',
+        labels={'apy': 'APY (%)', 'symbol': 'Pool'},
+        color='chain',
+        hover_data={'project': True, 'tvlUsd': ':,.0f', 'apy': ':.2f'}
+    )
+    fig.update_traces(texttemplate='%{x:.1f}%', textposition='outside')
+    fig.update_layout(
+        height=450,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5)
+    )
+    return fig
+
 # ---------- DATA ----------
 with st.spinner("📊 Fetching fresh data…"):
+    reqs = (
+        (PROTOCOLS_URL, None),
+        ("https://api.llama.fi/chains", None),
+        ("https://stablecoins.llama.fi/stablecoins", None),
+        (POOLS_URL, None),
+        (
+            "https://api.coingecko.com/api/v3/simple/price",
+            (
+                ('ids', ','.join(coin_id for coin_id, _, _ in PRICE_COINS)),
+                ('vs_currencies', 'usd'),
+                ('include_24hr_change', 'true'),
+            ),
+        ),
+    )
+    results = fetch_all(reqs)
+    for (url, _), result in zip(reqs, results):
+        if result is None:
+            st.warning(f"⚠️ API request failed: {url}")
+    raw_protocols, raw_chains, raw_stables, raw_yields, prices = (r or {} for r in results)
+
     # Protocols
-    raw = _fetch("https://api.llama.fi/protocols")
-    if raw:
-        protocols = pd.DataFrame(raw)
-        protocols['tvl'] = pd.to_numeric(protocols.get('tvl', 0), errors='coerce').fillna(0)
-        protocols['change_1d'] = pd.to_numeric(protocols.get('change_1d', 0), errors='coerce').fillna(0)
-        protocols = protocols.sort_values('tvl', ascending=False).head(10)
+    if raw_protocols:
+        protocols = _frame(raw_protocols, PROTOCOL_SCHEMA)
+        protocols['tvl'] = safe_num(protocols, 'tvl')
+        protocols['change_1d'] = safe_num(protocols, 'change_1d')
+        protocols = protocols.nlargest(10, 'tvl')
+        total_defi_tvl = float(protocols['tvl'].to_numpy().sum())
     else:
         protocols = pd.DataFrame()
+        total_defi_tvl = 0
 
     # Chains
-    raw = _fetch("https://api.llama.fi/chains")
-    if raw:
-        chains = pd.DataFrame(raw)
-        chains['tvl'] = pd.to_numeric(chains.get('tvl', 0), errors='coerce').fillna(0)
-        chains = chains.sort_values('tvl', ascending=False).head(10)
+    if raw_chains:
+        chains = _frame(raw_chains, CHAIN_SCHEMA)
+        chains['tvl'] = safe_num(chains, 'tvl')
+        chains = chains.nlargest(10, 'tvl')
+        total_chain_tvl = float(chains['tvl'].to_numpy().sum())
     else:
         chains = pd.DataFrame()
+        total_chain_tvl = 0
 
     # Stablecoins
-    raw = _fetch("https://stablecoins.llama.fi/stablecoins")
-    if raw and 'peggedAssets' in raw:
-        assets = raw.get('peggedAssets', [])
-        stables = pd.DataFrame(assets)
-        def usd(x):
-            return x.get('peggedUSD', 0) if isinstance(x, dict) else 0
-        stables['circulating_usd'] = stables['circulating'].apply(usd)
-        stables = stables.sort_values('circulating_usd', ascending=False).head(6)
+    if raw_stables and 'peggedAssets' in raw_stables:
+        assets = raw_stables.get('peggedAssets', [])
+        stables = _frame(assets, STABLECOIN_SCHEMA)
+        stables['circulating_usd'] = safe_num(stables, 'circulating.peggedUSD')
+        stables = stables.nlargest(6, 'circulating_usd')
+        total_stable_cap = float(stables['circulating_usd'].to_numpy().sum())
     else:
         stables = pd.DataFrame()
+        total_stable_cap = 0
 
-    # Yields
-    raw = _fetch("https://yields.llama.fi/pools")
-    if raw and 'data' in raw:
-        yields = pd.DataFrame(raw.get('data', []))
-        if not yields.empty:
-            yields['apy'] = pd.to_numeric(yields.get('apy', 0), errors='coerce').fillna(0)
-            yields['tvlUsd'] = pd.to_numeric(yields.get('tvlUsd', 0), errors='coerce').fillna(0)
-            yields = yields[yields['apy'].gt(min_apy) & yields['apy'].lt(1000)]
-            yields = yields.sort_values('apy', ascending=False).head(12)
-    else:
-        yields = pd.DataFrame()
-
-    # Prices with 24h change
-    prices = _fetch(
-        "https://api.coingecko.com/api/v3/simple/price",
-        params={
-            'ids': 'bitcoin,ethereum,solana,cardano,polkadot,avalanche-2,chainlink,polygon',
-            'vs_currencies': 'usd',
-            'include_24hr_change': 'true'
-        }
-    )
+    # Yields - filtered by Min APY inside yields_section() below
+    pools = raw_yields.get('data', [])
 
 # ---------- PRICE METRICS ----------
 st.subheader("💰 Top Cryptocurrencies")
 
-price_coins = [
-    ('bitcoin', 'Bitcoin', '₿'),
-    ('ethereum', 'Ethereum', 'Ξ'),
-    ('solana', 'Solana', 'SOL'),
-    ('cardano', 'Cardano', 'ADA'),
-    ('polkadot', 'Polkadot', 'DOT'),
-    ('avalanche-2', 'Avalanche', 'AVAX'),
-    ('chainlink', 'Chainlink', 'LINK'),
-    ('polygon', 'Polygon', 'MATIC'),
-]
-
-cols = st.columns(4)
-for idx, (coin_id, name, symbol) in enumerate(price_coins):
-    with cols[idx % 4]:
+if prices:
+    # Resolve every coin up front so the column loop below only renders
+    price_rows = []
+    for coin_id, name, symbol in PRICE_COINS:
         coin_data = prices.get(coin_id, {})
-        price = coin_data.get('usd', 0)
-        change = coin_data.get('usd_24h_change', 0)
-        
-        if price > 0:
-            st.metric(
-                f"{symbol} {name}",
-                f"${price:,.2f}" if price < 1000 else f"${price:,.0f}",
-                f"{change:+.2f}%",
-                delta_color="normal"
-            )
-        else:
-            st.metric(f"{symbol} {name}", "N/A", "0.00%")
+        price_rows.append((f"{symbol} {name}", coin_data.get('usd', 0), coin_data.get('usd_24h_change', 0)))
+
+    cols = st.columns(4)
+    for idx, (label, price, change) in enumerate(price_rows):
+        with cols[idx % 4]:
+            if price > 0:
+                st.metric(
+                    label,
+                    (_fmt_usd_cents if price < 1000 else _fmt_usd_whole)(price),
+                    _fmt_pct(change),
+                    delta_color="normal"
+                )
+            else:
+                st.metric(label, "N/A", "0.00%")
+else:
+    st.info("Price data unavailable")
 
 st.markdown("---")
 
@@ -158,52 +360,28 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("📈 Top 10 DeFi Protocols by TVL")
     if not protocols.empty:
-        fig = px.bar(
-            protocols, 
-            x='name', 
-            y='tvl', 
-            color='category',
-            labels={'tvl': 'TVL (USD)', 'name': 'Protocol'},
-            text=protocols['tvl'].apply(fmt_b),
-            hover_data={'tvl': ':,.0f', 'change_1d': ':.2f'}
-        )
-        fig.update_traces(textposition='outside')
-        fig.update_layout(
-            height=500, 
-            showlegend=True,
-            xaxis_tickangle=45,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = build_protocols_chart(protocols[['name', 'category', 'tvl', 'change_1d']])
         st.plotly_chart(fig, use_container_width=True)
 
         with st.expander("📊 View Raw Data"):
-            display_df = protocols[['name', 'category', 'tvl', 'change_1d']].copy()
-            display_df['tvl'] = display_df['tvl'].apply(lambda x: f"${x:,.0f}")
-            display_df['change_1d'] = display_df['change_1d'].apply(lambda x: f"{x:.2f}%")
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(
+                protocols[['name', 'category', 'tvl', 'change_1d']].head(MAX_RAW_ROWS).style.format({'tvl': '${:,.0f}', 'change_1d': '{:.2f}%'}),
+                use_container_width=True
+            )
     else:
         st.info("Protocol data unavailable")
 
 with col2:
     st.subheader("⛓️ Top 10 Blockchains by TVL")
     if not chains.empty:
-        fig = px.bar(
-            chains, 
-            x='name', 
-            y='tvl',
-            labels={'tvl': 'TVL (USD)', 'name': 'Chain'},
-            color='name', 
-            text=chains['tvl'].apply(fmt_b),
-            color_discrete_sequence=px.colors.qualitative.Bold
-        )
-        fig.update_traces(textposition='outside', showlegend=False)
-        fig.update_layout(height=500, xaxis_tickangle=45)
+        fig = build_chains_chart(chains[['name', 'tvl']])
         st.plotly_chart(fig, use_container_width=True)
 
         with st.expander("📊 View Raw Data"):
-            display_df = chains[['name', 'tvl']].copy()
-            display_df['tvl'] = display_df['tvl'].apply(lambda x: f"${x:,.0f}")
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(
+                chains[['name', 'tvl']].head(MAX_RAW_ROWS).style.format({'tvl': '${:,.0f}'}),
+                use_container_width=True
+            )
     else:
         st.info("Chain data unavailable")
 
@@ -213,78 +391,67 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("💵 Top Stablecoins by Market Cap")
     if not stables.empty:
-        fig = px.pie(
-            stables, 
-            names='symbol', 
-            values='circulating_usd',
-            color_discrete_sequence=px.colors.sequential.Viridis,
-            hole=0.4
-        )
-        fig.update_traces(
-            textinfo='percent+label',
-            textposition='auto',
-            hovertemplate='<b>%{label}</b><br>Market Cap: $%{value:,.0f}<extra></extra>'
-        )
-        fig.update_layout(height=450)
+        fig = build_stables_chart(stables[['symbol', 'circulating_usd']])
         st.plotly_chart(fig, use_container_width=True)
 
         with st.expander("📊 View Raw Data"):
-            display_df = stables[['name', 'symbol', 'circulating_usd']].copy()
-            display_df['circulating_usd'] = display_df['circulating_usd'].apply(lambda x: f"${x:,.0f}")
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(
+                stables[['name', 'symbol', 'circulating_usd']].head(MAX_RAW_ROWS).style.format({'circulating_usd': '${:,.0f}'}),
+                use_container_width=True
+            )
     else:
         st.info("Stablecoin data unavailable")
 
-with col2:
-    st.subheader(f"🌾 High-Yield Pools (>{min_apy}% APY)")
-    if not yields.empty:
-        # Limit to top 10 for better display
-        yields_display = yields.head(10)
-        fig = px.bar(
-            yields_display, 
-            y='symbol', 
-            x='apy', 
-            orientation='h',
-            labels={'apy': 'APY (%)', 'symbol': 'Pool'},
-            color='chain',
-            text=yields_display['apy'],
-            hover_data={'project': True, 'tvlUsd': ':,.0f', 'apy': ':.2f'}
-        )
-        fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-        fig.update_layout(
-            height=450,
-            legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5)
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-        with st.expander("📊 View Raw Data"):
-            display_df = yields[['symbol', 'project', 'chain', 'apy', 'tvlUsd']].copy()
-            display_df['apy'] = display_df['apy'].apply(lambda x: f"{x:.2f}%")
-            display_df['tvlUsd'] = display_df['tvlUsd'].apply(lambda x: f"${x:,.0f}")
-            st.dataframe(display_df, use_container_width=True)
-    else:
-        st.info(f"No pools found with APY > {min_apy}%")
-
 # ---------- SUMMARY STATS ----------
 st.markdown("---")
 st.subheader("📊 Market Summary")
 
 sum_cols = st.columns(4)
 with sum_cols[0]:
-    total_defi_tvl = protocols['tvl'].sum() if not protocols.empty else 0
     st.metric("Total DeFi TVL (Top 10)", fmt_b(total_defi_tvl))
 
 with sum_cols[1]:
-    total_chain_tvl = chains['tvl'].sum() if not chains.empty else 0
     st.metric("Total Chain TVL (Top 10)", fmt_b(total_chain_tvl))
 
 with sum_cols[2]:
-    total_stable_cap = stables['circulating_usd'].sum() if not stables.empty else 0
     st.metric("Stablecoin Market Cap", fmt_b(total_stable_cap))
 
-with sum_cols[3]:
-    avg_apy = yields['apy'].mean() if not yields.empty else 0
-    st.metric("Avg High-Yield APY", f"{avg_apy:.1f}%")
+# Filled in by yields_section(), which depends on the Min APY filter
+apy_slot = sum_cols[3].empty()
+
+# ---------- YIELDS ----------
+# A fragment, so changing Min APY reruns only this section (and its summary metric)
+# instead of the whole page. Called after the summary row exists so it can write to apy_slot.
+@st.fragment
+def yields_section(pools, apy_slot):
+    min_apy = st.number_input("Min APY Filter (%)", min_value=0, max_value=100, value=10, step=5)
+
+    # Filter and take the top 12 on the raw records so only those rows become a DataFrame
+    top = heapq.nlargest(12, (p for p in pools if min_apy < _apy(p) < 1000), key=_apy)
+    yields = _frame(top, POOL_SCHEMA)
+    yields['apy'] = safe_num(yields, 'apy')
+    yields['tvlUsd'] = safe_num(yields, 'tvlUsd')
+
+    st.subheader(f"🌾 High-Yield Pools (>{min_apy}% APY)")
+    if not yields.empty:
+        # Limit to top 10 for better display
+        yields_display = yields.head(10)
+        fig = build_yields_chart(yields_display[['symbol', 'project', 'chain', 'apy', 'tvlUsd']])
+        st.plotly_chart(fig, use_container_width=True)
+
+        with st.expander("📊 View Raw Data"):
+            st.dataframe(
+                yields[['symbol', 'project', 'chain', 'apy', 'tvlUsd']].head(MAX_RAW_ROWS).style.format({'apy': '{:.2f}%', 'tvlUsd': '${:,.0f}'}),
+                use_container_width=True
+            )
+    else:
+        st.info(f"No pools found with APY > {min_apy}%")
+
+    avg_apy = float(yields['apy'].to_numpy().mean()) if not yields.empty else 0
+    apy_slot.metric("Avg High-Yield APY", f"{avg_apy:.1f}%")
+
+with col2:
+    yields_section(pools, apy_slot)
 
 st.markdown("---")
 st.caption("📡 Data Sources: DeFiLlama, CoinGecko | Built with Streamlit | Updates every 60 seconds")